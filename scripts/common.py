@@ -1,4 +1,6 @@
 import os
+import functools
+import shutil
 import subprocess
 import json
 from pathlib import Path
@@ -9,11 +11,38 @@ import numpy as np
 from typing import Optional, Dict
 import pandas as pd
 import plotly.graph_objects as go
-from typing import List
+from typing import Iterable, Iterator, List, Union
+
+def _run_streamed(cmd, env=None, cwd=None, bufsize: int = 1 << 16) -> str:
+    """
+    Run a command and collect its combined stdout/stderr while it runs.
+
+    Output is read line by line from the pipe so the child never blocks on a
+    full pipe buffer, and the lines are joined once at the end.
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits non-zero. The
+            collected output is attached as e.output.
+    """
+    chunks = []
+    with subprocess.Popen(cmd, env=env, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=bufsize) as p:
+        for line in p.stdout:
+            chunks.append(line)
+    output = "".join(chunks)
+    if p.returncode:
+        raise subprocess.CalledProcessError(p.returncode, cmd, output=output)
+    return output
 
 def get_last_n_commit_hashes(repo_path, n):
     if not os.path.isdir(repo_path):
         raise ValueError(f"'{repo_path}' is not a valid directory.")
+    # Normalize the path so equivalent spellings share one cache entry
+    return list(_last_n_commit_hashes(os.path.abspath(repo_path), n))
+
+@functools.lru_cache(maxsize=32)
+def _last_n_commit_hashes(repo_path, n):
+    # Cached per (repo_path, n) for the lifetime of the process; the
+    # develop log does not move while a perf sweep is running.
     try:
         # Get commit hashes using git log
         result = subprocess.run(
@@ -23,8 +52,8 @@ def get_last_n_commit_hashes(repo_path, n):
             text=True,
             check=True
         )
-        # Split into list of commit hashes
-        return result.stdout.strip().splitlines()
+        # Split into tuple of commit hashes (immutable, it is cached)
+        return tuple(result.stdout.strip().splitlines())
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"Git command failed: {e.stderr.strip()}") from e
     
@@ -86,15 +115,89 @@ def clone_rccl_tests(scratch_dir: str, repo_url: str = "https://github.com/ROCm/
     return rccl_tests_path
 
 
+def _commit_worktree_path(repo_path: Path, commit_hash: str, worktrees_dir: Optional[str] = None) -> Path:
+    worktrees_path = Path(worktrees_dir).resolve() if worktrees_dir else repo_path.parent / "worktrees"
+    return worktrees_path / commit_hash
+
+def _list_worktrees(repo_path: Path) -> Dict[Path, str]:
+    """
+    Map each usable worktree of a repository to its checked out commit, as
+    reported by git worktree list (prunable, i.e. broken, worktrees are skipped).
+    """
+    out = subprocess.run(["git", "-C", str(repo_path), "worktree", "list", "--porcelain"],
+                         check=True, capture_output=True, text=True).stdout
+    worktrees = {}
+    for entry in out.strip().split("\n\n"):
+        fields = dict(line.partition(" ")[::2] for line in entry.splitlines())
+        if "worktree" in fields and "prunable" not in fields:
+            worktrees[Path(fields["worktree"]).resolve()] = fields.get("HEAD", "")
+    return worktrees
+
+def get_commit_worktree(repo_dir: str, commit_hash: str, worktrees_dir: Optional[str] = None) -> Path:
+    """
+    Get a git worktree of a repository checked out at a given commit, creating it on first use.
+
+    Each commit gets its own directory, so builds of different commits never
+    share (or re-checkout) one working tree and can run side by side. A
+    directory left behind by an interrupted git worktree add is not reused
+    but recreated. Remove the worktree with remove_commit_worktree once done.
+
+    Args:
+        repo_dir (str): Path to the git repository.
+        commit_hash (str): Commit to check out.
+        worktrees_dir (Optional[str]): Parent directory of the worktrees
+            (default: "worktrees" next to the repository).
+
+    Returns:
+        Path: Path to the worktree.
+
+    Raises:
+        subprocess.CalledProcessError: If git worktree add fails.
+    """
+    repo_path = Path(repo_dir).resolve()
+    worktree_path = _commit_worktree_path(repo_path, commit_hash, worktrees_dir)
+    head = _list_worktrees(repo_path).get(worktree_path)
+    if head is None or not head.startswith(commit_hash):
+        remove_commit_worktree(repo_path, commit_hash, worktrees_dir)
+        worktree_path.parent.mkdir(parents=True, exist_ok=True)
+        subprocess.run(["git", "-C", str(repo_path), "worktree", "add", "--detach", str(worktree_path), commit_hash], check=True)
+    return worktree_path
+
+def remove_commit_worktree(repo_dir: str, commit_hash: str, worktrees_dir: Optional[str] = None) -> None:
+    """
+    Remove the worktree of a commit created by get_commit_worktree, build tree included.
+
+    Args:
+        repo_dir (str): Path to the git repository.
+        commit_hash (str): Commit of the worktree.
+        worktrees_dir (Optional[str]): Parent directory of the worktrees, as
+            passed to get_commit_worktree.
+
+    Raises:
+        subprocess.CalledProcessError: If git worktree remove fails.
+    """
+    repo_path = Path(repo_dir).resolve()
+    worktree_path = _commit_worktree_path(repo_path, commit_hash, worktrees_dir)
+    if worktree_path in _list_worktrees(repo_path):
+        subprocess.run(["git", "-C", str(repo_path), "worktree", "remove", "--force", str(worktree_path)], check=True)
+    # Leftovers of a failed add are not registered with git, delete them directly
+    shutil.rmtree(worktree_path, ignore_errors=True)
+    subprocess.run(["git", "-C", str(repo_path), "worktree", "prune"], check=True)
+
 def build_rccl(rccl_dir: str, commit_hash: Optional[str] = None, jobs: int = 32) -> str:
     """
-    Clone a specific commit of RCCL and build it using the install script.
+    Build a specific commit of RCCL using the install script.
 
     Args:
         rccl_dir (str): Path to the RCCL repository.
-        commit_hash (Optional[str]): Git commit hash to check out before build.
+        commit_hash (Optional[str]): Git commit hash to build. It is built in
+            its own worktree (see get_commit_worktree) instead of checking it
+            out in rccl_dir; free it with remove_commit_worktree when done.
         jobs (int): Number of parallel jobs for the build (default 32).
 
+    Returns:
+        str: Path to the built librccl.so.
+
     Raises:
         subprocess.CalledProcessError: If any command fails.
         FileNotFoundError: If rccl_dir or install.sh doesn't exist.
@@ -102,9 +205,8 @@ def build_rccl(rccl_dir: str, commit_hash: Optional[str] = None, jobs: int = 32)
     rccl_path = Path(rccl_dir).resolve()
     if not rccl_path.exists():
         raise FileNotFoundError(f"RCCL directory not found: {rccl_path}")
-    os.chdir(rccl_path)
     if commit_hash:
-        subprocess.run(["git", "checkout", commit_hash], check=True)
+        rccl_path = get_commit_worktree(rccl_path, commit_hash)
 
     install_script = rccl_path / "install.sh"
     if not install_script.exists():
@@ -113,7 +215,7 @@ def build_rccl(rccl_dir: str, commit_hash: Optional[str] = None, jobs: int = 32)
     try:
         env = os.environ.copy()
         env["ONLY_FUNCS"] = "AllReduce|Reduce"
-        result = subprocess.run(["bash","install.sh", "-l","--debug",f"-j{jobs}"],env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,text=True, check=True) 
+        _run_streamed(["bash","install.sh", "-l","--debug",f"-j{jobs}"],env=env, cwd=rccl_path)
         print("✅ RCCL build completed.")
     except subprocess.CalledProcessError as e:
         print(e.output)
@@ -156,30 +258,32 @@ def build_rccl_tests(
 
 # def build_TransferBench():
 
-def run_rccl_test(
-    coll: str,
-    tag: str,
-    total_ranks: int = 8,
-    workdir: Optional[str] = None,
-    mpi_install_dir: str = "/opt/ompi5",
-    rocm_path: str = "/opt/rocm",
-    rccl_test_bin_subdir: str = "rccl-tests/build",
-    rt_args_dict:Optional[Dict[str, str]] = None
-) -> str:
+@functools.lru_cache(maxsize=8)
+def _rccl_test_env(mpi_install_dir: str, rocm_path: str):
     """
-    Run RCCL test for a specified collective and save the debug log.
+    Snapshot of os.environ plus the PATH/LD_LIBRARY_PATH values for an
+    rccl-tests run, computed once per (mpi_install_dir, rocm_path).
+    """
+    env_path = f"{mpi_install_dir}/bin:{rocm_path}/bin:{os.environ['PATH']}"
+    env_ld = f"{mpi_install_dir}/lib:{os.environ.get('LD_LIBRARY_PATH', '')}"
+    return dict(os.environ), env_path, env_ld
 
-    Args:
-        coll (str): Collective name, e.g., 'all_reduce'.
-        tag (str): Custom tag for output filename.
-        total_ranks (int): Number of MPI ranks (default 8).
-        workdir (Optional[str]): Working directory. Uses current if None.
-        mpi_install_dir (str): Path to MPI installation.
-        rocm_path (str): Path to ROCm installation.
-        rccl_test_bin_subdir (str): path to RCCL test binaries directory.
+def _rccl_test_command(
+    coll: str,
+    total_ranks: int,
+    workdir: Optional[str],
+    mpi_install_dir: str,
+    rocm_path: str,
+    rccl_test_bin_subdir: str,
+    rt_args_dict: Optional[Dict[str, str]],
+    rccl_lib_dir: Optional[str] = None
+):
+    """
+    Build the command line, environment and working directory for an rccl-tests run.
 
-    Returns:
-        generated log
+    rccl_lib_dir, if given, is put first on LD_LIBRARY_PATH so the test loads
+    that librccl (e.g. a per-commit worktree build) instead of the one it was
+    linked against.
     """
     MPI = 0
     g = 8
@@ -204,9 +308,10 @@ def run_rccl_test(
     
     workdir = workdir or os.getcwd()
     rccl_test_binary = os.path.join(rccl_test_bin_subdir,f"{coll}_perf")
-    env = os.environ.copy()
-    env_path = f"{mpi_install_dir}/bin:{rocm_path}/bin:{os.environ['PATH']}"
-    env_ld = f"{mpi_install_dir}/lib:{os.environ.get('LD_LIBRARY_PATH', '')}"
+    base_env, env_path, env_ld = _rccl_test_env(mpi_install_dir, rocm_path)
+    env = base_env.copy()  # shallow copy, the cached dict is shared
+    if rccl_lib_dir:
+        env_ld = f"{rccl_lib_dir}:{env_ld}"
     cmd = []
     if MPI:
         cmd = [
@@ -220,49 +325,142 @@ def run_rccl_test(
     else:
         cmd = [str(rccl_test_binary)]
         env["NCCL_DEBUG"]="VERSION"
+        if rccl_lib_dir:
+            ld = env.get("LD_LIBRARY_PATH")
+            env["LD_LIBRARY_PATH"] = f"{rccl_lib_dir}:{ld}" if ld else rccl_lib_dir
     for flag, val in merged_args.items():
         cmd.extend([flag, val])
-    result = None
+    return cmd, env, workdir
+
+def run_rccl_test(
+    coll: str,
+    tag: str,
+    total_ranks: int = 8,
+    workdir: Optional[str] = None,
+    mpi_install_dir: str = "/opt/ompi5",
+    rocm_path: str = "/opt/rocm",
+    rccl_test_bin_subdir: str = "rccl-tests/build",
+    rt_args_dict:Optional[Dict[str, str]] = None,
+    rccl_lib_dir: Optional[str] = None
+) -> str:
+    """
+    Run RCCL test for a specified collective and save the debug log.
+
+    Args:
+        coll (str): Collective name, e.g., 'all_reduce'.
+        tag (str): Custom tag for output filename.
+        total_ranks (int): Number of MPI ranks (default 8).
+        workdir (Optional[str]): Working directory. Uses current if None.
+        mpi_install_dir (str): Path to MPI installation.
+        rocm_path (str): Path to ROCm installation.
+        rccl_test_bin_subdir (str): path to RCCL test binaries directory.
+        rccl_lib_dir (Optional[str]): Directory of the librccl to load instead
+            of the one the tests were linked against.
+
+    Returns:
+        generated log
+    """
+    cmd, env, workdir = _rccl_test_command(coll, total_ranks, workdir, mpi_install_dir, rocm_path, rccl_test_bin_subdir, rt_args_dict, rccl_lib_dir)
     try:
-        result = subprocess.run(cmd,env=env, cwd=workdir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,text=True, check=True) 
-        return str(result.stdout)
+        return _run_streamed(cmd,env=env, cwd=workdir)
     except subprocess.CalledProcessError as e:
         return str(e.output)
 
-def parse_rccl_tests_output(rccl_tests_log_str):
-    data = []
-    regexstr1 = r"\s*(-?\d+)\s+(-?\d+)\s+(\S+)\s+(\S+)\s+(-?\d+)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+((-?\d+)|N/A)"
-    regexstr2 = r"\s*(-?\d+)\s+(-?\d+)\s+(\S+)\s+(-?\d+)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+((-?\d+)|N/A)"
-    pattern1 = re.compile(regexstr1)
-    pattern2 = re.compile(regexstr2)
-    for line in io.StringIO(rccl_tests_log_str):
-        # Skip lines that start with '##' or don't match the regex pattern
-        if line.startswith('##') or not (pattern1.match(line) or pattern2.match(line)):
-            continue
-
-        # Split line into columns (handle variable spacing)
-        columns = line.split()
-            
-        # Ensure the line has the expected number of fields
-        if len(columns) >= 12:
-            i = 1 if pattern1.match(line) else 0
-            entry = {
-                "size": np.int64(columns[0]),
-                "elements": np.int64(columns[1]),
-                "type": columns[2],
-                "redop": columns[2+i] if i else 'none',
-                "root": np.int64(columns[3+i]),
-                "op_time(us)": float(columns[4+i]),
-                "op_algbw(GB/s)": float(columns[5+i]),
-                "op_busbw(GB/s)": float(columns[6+i]),
-                "op_wrong": np.int64(columns[7+i]) if columns[7+i].isdigit() or (columns[7+i][1:].isdigit() if columns[7+i].startswith('-') else False) else 0,
-                "ip_time(us)": float(columns[8+i]),
-                "ip_algbw(GB/s)": float(columns[9+i]),
-                "ip_busbw(GB/s)": float(columns[10+i]),
-                "ip_wrong":np.int64(columns[11+i]) if columns[11+i].isdigit() or (columns[11+i][1:].isdigit() if columns[11+i].startswith('-') else False) else 0,
-            }
-        data.append(entry)          
-    return data
+def stream_rccl_test(
+    coll: str,
+    tag: str,
+    total_ranks: int = 8,
+    workdir: Optional[str] = None,
+    mpi_install_dir: str = "/opt/ompi5",
+    rocm_path: str = "/opt/rocm",
+    rccl_test_bin_subdir: str = "rccl-tests/build",
+    rt_args_dict:Optional[Dict[str, str]] = None,
+    rccl_lib_dir: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Same as run_rccl_test, but yields the log line by line while the test runs.
+
+    Feeding this straight into parse_rccl_tests_output overlaps parsing with
+    the test run and avoids holding the whole log as one string.
+
+    Yields:
+        str: Lines of the combined stdout/stderr, including line endings.
+    """
+    cmd, env, workdir = _rccl_test_command(coll, total_ranks, workdir, mpi_install_dir, rocm_path, rccl_test_bin_subdir, rt_args_dict, rccl_lib_dir)
+    with subprocess.Popen(cmd, env=env, cwd=workdir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1 << 16) as p:
+        yield from p.stdout
+
+RCCL_TESTS_COLUMNS = [
+    "size", "elements", "type", "redop", "root",
+    "op_time(us)", "op_algbw(GB/s)", "op_busbw(GB/s)", "op_wrong",
+    "ip_time(us)", "ip_algbw(GB/s)", "ip_busbw(GB/s)", "ip_wrong",
+]
+RCCL_TESTS_DTYPES = {
+    "size": np.int64,
+    "elements": np.int64,
+    "type": str,
+    "redop": str,
+    "root": np.int64,
+    "op_time(us)": np.float64,
+    "op_algbw(GB/s)": np.float64,
+    "op_busbw(GB/s)": np.float64,
+    "op_wrong": "Int64",  # nullable: may be N/A, filled with 0 after parsing
+    "ip_time(us)": np.float64,
+    "ip_algbw(GB/s)": np.float64,
+    "ip_busbw(GB/s)": np.float64,
+    "ip_wrong": "Int64",  # nullable: may be N/A, filled with 0 after parsing
+}
+
+_NUM = r"-?\d+(?:\.\d+)?"
+_WRONG = r"-?\d+|N/A"
+# One data row of the rccl-tests result table, with or without the redop column
+RCCL_TESTS_ROW_PATTERN = re.compile(
+    r"^\s*(?P<size>-?\d+)\s+(?P<elements>-?\d+)\s+(?P<type>\S+)(?:\s+(?P<redop>\S+))?\s+(?P<root>-?\d+)"
+    rf"\s+(?P<op_time>{_NUM})\s+(?P<op_algbw>{_NUM})\s+(?P<op_busbw>{_NUM})\s+(?P<op_wrong>{_WRONG})"
+    rf"\s+(?P<ip_time>{_NUM})\s+(?P<ip_algbw>{_NUM})\s+(?P<ip_busbw>{_NUM})\s+(?P<ip_wrong>{_WRONG})"
+)
+
+def parse_rccl_tests_output(rccl_tests_log: Union[str, Iterable[str]]) -> pd.DataFrame:
+    """
+    Parse the result table of an rccl-tests log into a DataFrame.
+
+    Only the data rows are kept; the remaining text is handed to pandas' C
+    tokenizer in one go instead of being matched and split line by line.
+    Logs without a redop column get redop='none'. '#wrong' values that are
+    not numbers (N/A) are reported as 0.
+
+    Args:
+        rccl_tests_log (str | Iterable[str]): Full stdout of an rccl-tests run,
+            or its lines (e.g. an open file or stream_rccl_test()).
+
+    Returns:
+        pd.DataFrame: One row per data line, columns as in RCCL_TESTS_COLUMNS.
+    """
+    if isinstance(rccl_tests_log, str):
+        rccl_tests_log = rccl_tests_log.splitlines(keepends=True)
+    match = RCCL_TESTS_ROW_PATTERN.match  # local for the hot loop
+    rows = [line for line in rccl_tests_log if match(line)]
+    if not rows:
+        return pd.DataFrame(columns=RCCL_TESTS_COLUMNS)
+
+    # rccl-tests logs either carry a redop column or not
+    has_redop = match(rows[0]).group("redop") is not None
+    names = RCCL_TESTS_COLUMNS if has_redop else [c for c in RCCL_TESTS_COLUMNS if c != "redop"]
+    df = pd.read_csv(
+        io.StringIO("".join(rows)),
+        sep=r"\s+",
+        engine="c",
+        header=None,
+        names=names,
+        usecols=range(len(names)),
+        dtype={c: RCCL_TESTS_DTYPES[c] for c in names},
+        na_values=["N/A"],
+    )
+    if not has_redop:
+        df.insert(RCCL_TESTS_COLUMNS.index("redop"), "redop", "none")
+    for col in ("op_wrong", "ip_wrong"):
+        df[col] = df[col].fillna(0).astype(np.int64)
+    return df
 
 
 def generate_rccl_3d_plot(
@@ -281,19 +479,17 @@ def generate_rccl_3d_plot(
     with open(json_path) as f:
         data = json.load(f)
 
-    # Flatten into DataFrame
-    rows = []
-    for commit, entries in data.items():
-        for e in entries:
-            flat = {'commit': commit, 'size': float(e['size'])}
-            for k, v in e.items():
-                if k not in ('size',):
-                    try:
-                        flat[k] = float(v)
-                    except (ValueError, TypeError):
-                        flat[k] = v
-            rows.append(flat)
-    df = pd.DataFrame(rows)
+    # Flatten into DataFrame, one column at a time rather than a dict per row
+    df = pd.concat(
+        {commit: pd.DataFrame(entries) for commit, entries in data.items()},
+        names=['commit']
+    ).reset_index(level=0).reset_index(drop=True)
+    df['size'] = df['size'].astype(np.float64)
+    for col in df.columns.drop(['commit', 'size']):
+        try:
+            df[col] = df[col].astype(np.float64)
+        except (ValueError, TypeError):
+            pass  # non-numeric column such as type/redop
 
     # Default metrics if not provided
     if metrics is None:
@@ -306,28 +502,27 @@ def generate_rccl_3d_plot(
             "ip_busbw(GB/s)",
         ]
 
-    # Build traces: one per commit, but we map across all points per commit
-    traces = []
-    for commit in sorted(df['commit'].unique()):
-        sub = df[df['commit'] == commit]
-        trace = go.Scatter3d(
-            x=sub['size'],
-            y=[commit] * len(sub),  # treat commit as categorical axis
-            z=sub[metrics[0]],       # placeholder, will be updated
-            mode='markers',
-            name=commit,
-            marker=dict(size=4),
-            visible=True
-        )
-        traces.append(trace)
+    # A single trace for all commits instead of one per commit; the commit
+    # sits on the y axis and drives the marker color
+    df = df.sort_values('commit', kind='stable')
+    commit_index, _ = pd.factorize(df['commit'], sort=True)
+    trace = go.Scatter3d(
+        x=df['size'].to_numpy(),
+        y=df['commit'].to_numpy(),  # treat commit as categorical axis
+        z=df[metrics[0]].to_numpy(),  # placeholder, will be updated
+        mode='markers',
+        hovertemplate='commit: %{y}<br>size: %{x}<br>%{z}<extra></extra>',
+        marker=dict(size=4, color=commit_index, colorscale='Viridis')
+    )
+    traces = [trace]
 
     # Build layout with dropdown
     buttons = []
     for m in metrics:
         buttons.append(dict(
             args=[
-                # Update Z data array in each trace
-                {'z': [df[df['commit']==c][m] for c in sorted(df['commit'].unique())]},
+                # Update Z data array of the single trace
+                {'z': [df[m].to_numpy()]},
                 {'scene': {'zaxis': {'title': m}}}
             ],
             label=m,
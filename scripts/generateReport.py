@@ -1,18 +1,35 @@
 from openpyxl import Workbook,load_workbook
-from openpyxl.styles import PatternFill, Border, Side, Alignment, Font
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.styles import PatternFill, Border, Side, Alignment, Font, NamedStyle
 from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.worksheet.cell_range import CellRange
 import pandas as pd
 import os
-import re
-import io
+import hashlib
+import mmap
 import numpy as np
+from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import product
 from common import parse_rccl_tests_output
 
-def read_file_as_string(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    return content
+def iter_candidate_lines(filepath):
+    """
+    Yields the lines of a log file that can be rccl-tests data rows.
+
+    The file is read through a read-only mmap instead of being copied into
+    one string, and only lines whose first non-blank character is a digit
+    are decoded.
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b''):
+                if line.lstrip()[:1].isdigit():
+                    yield line.decode('utf-8')
 
 def concat_dataframes_with_key(df_map: dict[str, pd.DataFrame], column_name: str) -> pd.DataFrame:
     """
@@ -26,22 +43,82 @@ def concat_dataframes_with_key(df_map: dict[str, pd.DataFrame], column_name: str
     Returns:
         pd.DataFrame: Concatenated DataFrame.
     """
-    df_list = []
-    for key, df in df_map.items():
-        df_copy = df.copy()
-        df_copy[column_name] = key
-        df_list.append(df_copy)
-    return pd.concat(df_list, ignore_index=True)
+    # Let concat attach the keys as an index level instead of copying each frame
+    out = pd.concat(df_map, names=[column_name]).reset_index(level=0).reset_index(drop=True)
+    # Keep the key as the last column, as if it had been assigned
+    out[column_name] = out.pop(column_name)
+    return out
+
+DOWNCAST_INT_COLS = ["elements", "root", "op_wrong", "ip_wrong"]
+PARSED_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "rccldev"
+PARSED_CACHE_VERSION = 1  # bump when the parsed layout changes
+
+def parsed_cache_path(filepath) -> Path:
+    """
+    Returns the parquet cache file for a log, keyed on its path, mtime and size.
+    """
+    st = os.stat(filepath)
+    key = f"{PARSED_CACHE_VERSION}:{os.path.abspath(filepath)}:{st.st_mtime_ns}:{st.st_size}"
+    return PARSED_CACHE_DIR / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.parquet"
+
+def parse_log_file(filepath) -> pd.DataFrame:
+    """
+    Parses one rccl-tests log, reusing the cached DataFrame if the file is unchanged.
+
+    The cache needs a parquet engine (pyarrow); without one, or if the cache
+    directory is not writable, the log is simply parsed every time. A cache
+    entry that cannot be read is deleted and rebuilt from the log.
+    """
+    cache_path = parsed_cache_path(filepath)
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except ImportError:
+            pass
+        except Exception:
+            # Corrupt or truncated entry: drop it and parse the log again
+            cache_path.unlink(missing_ok=True)
+    df = parse_rccl_tests_output(iter_candidate_lines(filepath))
+    # Shrink the integer columns that rarely need 64 bits. Float columns stay
+    # float64: float32 would change the values written to the report.
+    for col in DOWNCAST_INT_COLS:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        # The cache is best effort; never leave a partial tmp file behind
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return df
+
+PARALLEL_PARSE_MIN_FILES = 4  # below this, process startup costs more than it saves
+
+def _parse_one(filepath):
+    return os.path.basename(filepath), parse_log_file(filepath)
 
 def read_folder_to_DFs(folder_path):
     rvList = {}
-    for filename in os.listdir(folder_path):
-        filepath = os.path.join(folder_path, filename)
-        if os.path.isfile(filepath) and (filename.endswith(".log") or filename.endswith(".txt")):
-            data = parse_rccl_tests_output(read_file_as_string(filepath))
-            if data:  # Only add sheets if there is data
-                df = pd.DataFrame(data)
-                rvList[filename] = df
+    filepaths = []
+    # DirEntry.is_file() reuses the type from the directory listing, no stat per file
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith((".log", ".txt")):
+                filepaths.append(entry.path)
+    if len(filepaths) < PARALLEL_PARSE_MIN_FILES:
+        results = [_parse_one(f) for f in filepaths]
+    else:
+        # Files are parsed independently, one task per file
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            futures = [ex.submit(_parse_one, f) for f in filepaths]
+            results = [future.result() for future in futures]
+    for filename, df in results:
+        if not df.empty:  # Only add sheets if there is data
+            rvList[filename] = df
     return rvList
 
 
@@ -62,51 +139,66 @@ def scatter_df_to_excel_tasks_by_columns(
     }
     """
     results = []
-    grouped = df.groupby([dtype_col, collective_col])
+    # Row positions per group in one pass, then plain positional slices
+    group_indices = df.groupby([dtype_col, collective_col]).indices
 
-    for (data_type, collective), group_df in grouped:
+    for (data_type, collective), idx in group_indices.items():
         result = {
             "filename": f"{data_type}.xlsx",
             "sheetname": str(collective),
-            "df": group_df.reset_index(drop=True)
+            "df": df.iloc[idx].reset_index(drop=True)
         }
         results.append(result)
 
     return results
 
 
-def power_of_two_to_str(power: int) -> str:
-    size_in_bytes = power
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    for unit in units:
-        if size_in_bytes < 1024:
-            return f"{int(size_in_bytes)}{unit}"
-        size_in_bytes /= 1024
-    return f"{int(size_in_bytes)}EB"
+SIZE_UNITS = np.array(["B", "KB", "MB", "GB", "TB", "PB", "EB"])
+# Smallest size of each unit after B: 1KB, 1MB, ... 1EB
+SIZE_UNIT_BOUNDS = np.array([1 << (10 * i) for i in range(1, len(SIZE_UNITS))], dtype=np.int64)
 
 def add_human_readable_size_column(df: pd.DataFrame, col_name: str, new_col_name: str = "Size") -> pd.DataFrame:
+    # Byte sizes as whole units (e.g. 1024 -> "1KB"), for the whole column at once
     df = df.copy()
-    readable_sizes = df[col_name].apply(power_of_two_to_str)
+    sizes = df[col_name].to_numpy(np.int64)
+    # Exact integer bucketing, no float log2 rounding near unit boundaries
+    exp = np.searchsorted(SIZE_UNIT_BOUNDS, sizes, side="right")
+    mant = sizes >> (10 * exp)
+    readable_sizes = np.char.add(mant.astype(str), SIZE_UNITS[exp])
     df.insert(0, new_col_name, readable_sizes)
     return df
 
-def fill_merged_block(start_row, end_row, start_col, end_col, text, fill_style, font,border,ws):
-    # Auto-unmerge overlapping blocks
-    new_range = set(
-        (r, c)
-        for r in range(start_row, end_row + 1)
-        for c in range(start_col, end_col + 1)
-    )
+STREAM_ROWS_THRESHOLD = 500  # stream data rows of write-only sheets larger than this
+STREAM_SLICE_ROWS = 256
+CENTER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
+YELLOW_FILL = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+WHITE_FILL = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")
+BOLD_FONT = Font(bold=True, color="000000")
+RED_BOLD_FONT = Font(bold=True, color="FF0000")
+# Named styles of the merged report blocks, see register_report_styles
+REPORT_STYLES = {
+    "report_yellow_bold": dict(fill=YELLOW_FILL, font=BOLD_FONT),
+    "report_yellow_red_bold": dict(fill=YELLOW_FILL, font=RED_BOLD_FONT),
+    "report_white_bold": dict(fill=WHITE_FILL, font=BOLD_FONT),
+}
 
-    for rng in list(ws.merged_cells.ranges):
-        min_col, min_row, max_col, max_row = rng.bounds
-        existing_range = set(
-            (r, c)
-            for r in range(min_row, max_row + 1)
-            for c in range(min_col, max_col + 1)
-        )
-        if new_range & existing_range:
-            ws.unmerge_cells(str(rng))
+def register_report_styles(wb):
+    """
+    Adds the REPORT_STYLES named styles to a workbook (once, existing ones are kept),
+    so block cells share one style record instead of separate fill/font/alignment.
+    """
+    for name, attrs in REPORT_STYLES.items():
+        if name not in wb.named_styles:
+            wb.add_named_style(NamedStyle(name=name, alignment=CENTER_ALIGN, **attrs))
+
+def fill_merged_block(start_row, end_row, start_col, end_col, text, style,border_style,ws,check_overlap=True):
+    # Auto-unmerge overlapping blocks (bounding-box test, no cell sets).
+    # Callers laying out known-disjoint blocks on a new sheet pass check_overlap=False.
+    if check_overlap:
+        for rng in list(ws.merged_cells.ranges):
+            min_col, min_row, max_col, max_row = rng.bounds
+            if not (end_row < min_row or start_row > max_row or end_col < min_col or start_col > max_col):
+                ws.unmerge_cells(str(rng))
 
     # Merge new block
     ws.merge_cells(
@@ -114,43 +206,116 @@ def fill_merged_block(start_row, end_row, start_col, end_col, text, fill_style,
         end_row=end_row, end_column=end_col
     )
 
-    # Set content and styles for the merged range
-    for r in range(start_row, end_row + 1):
-        for c in range(start_col, end_col + 1):
-            cell = ws.cell(row=r, column=c)
-            cell.border = border
-            cell.fill = fill_style
-            cell.font = font
-            cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
+    # A merged range is displayed with the top-left cell's content and style,
+    # so only that cell is styled; the edges just need the outer border
+    cell = ws.cell(row=start_row, column=start_col)
+    cell.style = style
     # Set text only in the top-left cell
     if text:
-        ws.cell(row=start_row, column=start_col).value = text
+        cell.value = text
+    draw_outer_border_only(ws, start_row, end_row, start_col, end_col, border_style)
         
-def draw_outer_border_only(ws, start_row, end_row, start_col, end_col, border_style="thin", color="000000"):
+@lru_cache(maxsize=None)
+def box_edge_borders(border_style="thin", color="000000"):
+    """
+    Returns the 16 possible borders of a box cell, keyed by which of its
+    (top, bottom, left, right) sides lie on the box outline.
+    """
     side = Side(border_style=border_style, color=color)
+    return {
+        (top, bottom, left, right): Border(
+            top=side if top else None,
+            bottom=side if bottom else None,
+            left=side if left else None,
+            right=side if right else None,
+        )
+        for top, bottom, left, right in product((False, True), repeat=4)
+    }
+
+def draw_outer_border_only(ws, start_row, end_row, start_col, end_col, border_style="thin", color="000000", rows=None):
+    # rows: optionally restrict drawing to these rows of the box (for sheets streamed in slices)
+    borders = box_edge_borders(border_style, color)
 
-    for r in range(start_row, end_row + 1):
-        for c in range(start_col, end_col + 1):
+    # Only cells on the outline get a border, the interior is left untouched.
+    # The outline sides are added to a cell's existing border, so sides drawn
+    # by an earlier, overlapping box (e.g. the thin header cells) are kept.
+    for r in (range(start_row, end_row + 1) if rows is None else rows):
+        if r == start_row or r == end_row:
+            cols = range(start_col, end_col + 1)
+        else:
+            cols = (start_col, end_col) if end_col > start_col else (start_col,)
+        for c in cols:
             cell = ws.cell(row=r, column=c)
-            border = Border()
+            edges = (r == start_row, r == end_row, c == start_col, c == end_col)
+            if not cell.has_style:
+                # Unstyled cell: nothing to keep, use the shared border
+                cell.border = borders[edges]
+                continue
+            outline = borders[edges]
+            cell.border = cell.border.copy(**{
+                name: getattr(outline, name)
+                for name, on in zip(("top", "bottom", "left", "right"), edges) if on
+            })
 
-            if r == start_row:
-                border = border + Border(top=side)
-            if r == end_row:
-                border = border + Border(bottom=side)
-            if c == start_col:
-                border = border + Border(left=side)
-            if c == end_col:
-                border = border + Border(right=side)
+class WriteOnlySheetBuffer:
+    """
+    Minimal stand-in for an openpyxl Worksheet on top of a write-only sheet.
 
-            cell.border = border
+    Supports the calls made by fill_merged_block, draw_outer_border_only and
+    write_custom_excel_sheet (cell, merge_cells, unmerge_cells, merged_cells).
+    Cells are kept as lightweight WriteOnlyCells and streamed to the sheet
+    row by row on flush(), so no full worksheet model is built.
+    """
+    def __init__(self, ws):
+        self._ws = ws
+        self._cells = {}
+        self._flushed_row = 0
+        self.merged_cells = ws.merged_cells
 
-def write_custom_excel_sheet(
-    filename,
+    def cell(self, row, column, value=None):
+        if row <= self._flushed_row:
+            raise ValueError(f"Row {row} has already been streamed to the sheet")
+        cell = self._cells.get((row, column))
+        if cell is None:
+            cell = WriteOnlyCell(self._ws)
+            self._cells[(row, column)] = cell
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def merge_cells(self, start_row, start_column, end_row, end_column):
+        self.merged_cells.add(CellRange(min_col=start_column, min_row=start_row, max_col=end_column, max_row=end_row))
+
+    def unmerge_cells(self, range_string):
+        rng = CellRange(range_string)
+        self.merged_cells.remove(rng)
+        # Same as Worksheet.unmerge_cells: only the top-left cell survives
+        for row, col in list(rng.cells)[1:]:
+            self._cells.pop((row, col), None)
+
+    def flush(self, through_row=None):
+        """
+        Streams the buffered rows up to through_row (default: all of them) to
+        the sheet. Those rows cannot be changed afterwards.
+        """
+        if through_row is None:
+            through_row = max((r for r, _ in self._cells), default=self._flushed_row)
+        max_col = max((c for r, c in self._cells if r <= through_row), default=0)
+        for r in range(self._flushed_row + 1, through_row + 1):
+            self._ws.append([self._cells.pop((r, c), None) for c in range(1, max_col + 1)])
+        self._flushed_row = max(self._flushed_row, through_row)
+
+def open_report_workbook(full_path):
+    # Load existing workbook or create new
+    if os.path.exists(full_path):
+        return load_workbook(full_path)
+    # New file: stream the sheets instead of building the full workbook model
+    return Workbook(write_only=True)
+
+def add_custom_excel_sheet(
+    wb,
     coll_name,
     df,
-    dir,
     box1_text="Box 1 Default", # BKC,ROCM,RCCL verisons
     box2_text="Box 2 Default", # cmd
     box3_text="Box 3",         # collective info
@@ -159,54 +324,30 @@ def write_custom_excel_sheet(
     TransferBenchBW = "? GB/s",
     header_row_texts=None
 ):
-    # Ensure directory exists
-    os.makedirs(dir, exist_ok=True)
-    full_path = os.path.join(dir, filename)
-
-    # Load existing workbook or create new
-    if os.path.exists(full_path):
-        wb = load_workbook(full_path)
-        # Remove existing sheet with the same name
-        if coll_name[:31] in wb.sheetnames:
-            std = wb[coll_name[:31]]
-            wb.remove(std)
-    else:
-        wb = Workbook()
-        # Remove default sheet if file is new
-        default = wb.active
-        wb.remove(default)
+    # Remove existing sheet with the same name
+    if not wb.write_only and coll_name[:31] in wb.sheetnames:
+        std = wb[coll_name[:31]]
+        wb.remove(std)
 
     # Create new sheet
     ws = wb.create_sheet(title=coll_name[:31])
+    if wb.write_only:
+        ws = WriteOnlySheetBuffer(ws)
 
-    yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-    white_fill = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")
-    thick_border = Border(
-        left=Side(style="thick", color="000000"),
-        right=Side(style="thick", color="000000"),
-        top=Side(style="thick", color="000000"),
-        bottom=Side(style="thick", color="000000")
-    )
-    thin_border = Border(
-        left=Side(style="thin", color="000000"),
-        right=Side(style="thin", color="000000"),
-        top=Side(style="thin", color="000000"),
-        bottom=Side(style="thin", color="000000")
-    )
-    center_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
     first_row = 2
-    fill_merged_block(first_row, first_row+7, 7, 14, box1_text, yellow_fill,Font(bold=True, color="000000"),thick_border,ws)   # G2:N9
-    fill_merged_block(first_row+8, first_row+16, 7, 14, box2_text, yellow_fill,Font(bold=True, color="FF0000"),thick_border,ws) # G10:N18
+    # The sheet is new and the blocks below do not overlap, so no merge needs undoing
+    fill_merged_block(first_row, first_row+7, 7, 14, box1_text, "report_yellow_bold","thick",ws,check_overlap=False)   # G2:N9
+    fill_merged_block(first_row+8, first_row+16, 7, 14, box2_text, "report_yellow_red_bold","thick",ws,check_overlap=False) # G10:N18
 
     # Fill white box groups
-    fill_merged_block(first_row+17, first_row+19, 1, 6, box3_text, white_fill,Font(bold=True, color="000000"),thick_border,ws)   # A19:F21
-    fill_merged_block(first_row+17, first_row+19, 7, 10, box4_text, white_fill,Font(bold=True, color="000000"),thick_border,ws)  # G19:J21
-    fill_merged_block(first_row+17, first_row+19, 11, 14, box5_text, white_fill,Font(bold=True, color="000000"),thick_border,ws) # K19:N21
+    fill_merged_block(first_row+17, first_row+19, 1, 6, box3_text, "report_white_bold","thick",ws,check_overlap=False)   # A19:F21
+    fill_merged_block(first_row+17, first_row+19, 7, 10, box4_text, "report_white_bold","thick",ws,check_overlap=False)  # G19:J21
+    fill_merged_block(first_row+17, first_row+19, 11, 14, box5_text, "report_white_bold","thick",ws,check_overlap=False) # K19:N21
     # Header row cells A22 to N24
     if header_row_texts is None:
         header_row_texts = [f"H{i+1}" for i in range(14)]
     for col_idx in range(14):
-        fill_merged_block(first_row+20, first_row+22, col_idx + 1, col_idx + 1, header_row_texts[col_idx], white_fill,Font(bold=True, color="000000"),thin_border,ws)
+        fill_merged_block(first_row+20, first_row+22, col_idx + 1, col_idx + 1, header_row_texts[col_idx], "report_white_bold","thin",ws,check_overlap=False)
     draw_outer_border_only(ws,first_row+20, first_row+22, 1, 6,"thick")
     draw_outer_border_only(ws,first_row+20, first_row+22, 7, 10,"thick")
     draw_outer_border_only(ws,first_row+20, first_row+22, 11, 14,"thick")
@@ -214,15 +355,70 @@ def write_custom_excel_sheet(
     num_rows = df.shape[0]
     data_start_row = first_row+23
     data_end_row = data_start_row+num_rows
-    draw_outer_border_only(ws,data_start_row, data_end_row, 1, 6,"thick")
-    draw_outer_border_only(ws,data_start_row, data_end_row, 7, 10,"thick")
-    draw_outer_border_only(ws,data_start_row, data_end_row, 11, 14,"thick")
-    for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=False), start=data_start_row):
-        for c_idx, value in enumerate(row, start=1):
-            cell = ws.cell(row=r_idx, column=c_idx, value=value)
-            cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    fill_merged_block(data_end_row,data_end_row+1,1,6,"TransferBench (XGMI) 1GB",white_fill,Font(bold=True, color="000000"),thick_border,ws)
-    fill_merged_block(data_end_row,data_end_row+1,7,14,TransferBenchBW,white_fill,Font(bold=True, color="000000"),thick_border,ws)
+    # Large write-only sheets are written in slices of rows, each streamed
+    # out once finished, so only one slice of cells is held in memory
+    streamed = wb.write_only and num_rows > STREAM_ROWS_THRESHOLD
+    slice_rows = STREAM_SLICE_ROWS if streamed else num_rows + 1
+    if streamed:
+        ws.flush(data_start_row - 1)
+    rows = df.itertuples(index=False, name=None)
+    for slice_start in range(data_start_row, data_end_row + 1, slice_rows):
+        row_slice = range(slice_start, min(slice_start + slice_rows, data_end_row + 1))
+        draw_outer_border_only(ws,data_start_row, data_end_row, 1, 6,"thick",rows=row_slice)
+        draw_outer_border_only(ws,data_start_row, data_end_row, 7, 10,"thick",rows=row_slice)
+        draw_outer_border_only(ws,data_start_row, data_end_row, 11, 14,"thick",rows=row_slice)
+        for r_idx, row in zip(row_slice, rows):
+            for c_idx, value in enumerate(row, start=1):
+                ws.cell(row=r_idx, column=c_idx, value=value).alignment = CENTER_ALIGN
+        # data_end_row is shared with the TransferBench block, keep it buffered
+        if streamed and row_slice[-1] < data_end_row:
+            ws.flush(row_slice[-1])
+    fill_merged_block(data_end_row,data_end_row+1,1,6,"TransferBench (XGMI) 1GB","report_white_bold","thick",ws,check_overlap=False)
+    fill_merged_block(data_end_row,data_end_row+1,7,14,TransferBenchBW,"report_white_bold","thick",ws,check_overlap=False)
+    if wb.write_only:
+        ws.flush()
+
+def write_custom_excel_sheet(
+    filename,
+    coll_name,
+    df,
+    dir,
+    box1_text="Box 1 Default", # BKC,ROCM,RCCL verisons
+    box2_text="Box 2 Default", # cmd
+    box3_text="Box 3",         # collective info
+    box4_text="Box 4",         # out of place
+    box5_text="Box 5",         # in place 
+    TransferBenchBW = "? GB/s",
+    header_row_texts=None
+):
+    write_custom_excel_workbook(filename, [dict(
+        coll_name=coll_name,
+        df=df,
+        box1_text=box1_text,
+        box2_text=box2_text,
+        box3_text=box3_text,
+        box4_text=box4_text,
+        box5_text=box5_text,
+        TransferBenchBW=TransferBenchBW,
+        header_row_texts=header_row_texts
+    )], dir)
+
+def write_custom_excel_workbook(filename, sheets: list[dict], dir):
+    """
+    Writes several sheets into one workbook, loading and saving it only once.
+
+    Args:
+        filename (str): Workbook file name inside dir.
+        sheets (list[dict]): Keyword arguments of add_custom_excel_sheet, one dict per sheet.
+        dir (str): Output directory, created if missing.
+    """
+    # Ensure directory exists
+    os.makedirs(dir, exist_ok=True)
+    full_path = os.path.join(dir, filename)
+    wb = open_report_workbook(full_path)
+    register_report_styles(wb)
+    for sheet in sheets:
+        add_custom_excel_sheet(wb, **sheet)
     # Save workbook
     wb.save(full_path)
     
@@ -230,17 +426,24 @@ def getBKCText(BKCversion:str,IFWI:str,RCCLversion:str, HIPverison:str, ROCMvers
     return f"BKC:{BKCversion}\n IFWI:{IFWI}\n\n RCCL:{RCCLversion}\n HIP:{HIPverison}\n ROCm:{ROCMversion}"
 
 def generateXLSXReport(data_folder_path:str, output_dir:str,bkcinfo:str,cmdstr:str, TransferBenchBW:str):
-    datasetdict = read_folder_to_DFs(folder_path)
+    datasetdict = read_folder_to_DFs(data_folder_path)
     combinedDF = concat_dataframes_with_key(datasetdict,"coll")
     group_cols = ['size','elements','type','redop','root',"coll"]
     combinedDF = combinedDF.groupby(group_cols,as_index=False).mean().sort_values(by=['coll','type','elements'])
     split_data = scatter_df_to_excel_tasks_by_columns(combinedDF,dtype_col='type',collective_col='coll')
     # writeDFToExcel(combinedDF,"combinedDF.xlsx")
     header_row_texts = ["size\n[H]","size\n[B]","count\n(elements)","type","redop","root","time\n(us)","algbw\n(GB/s)","bus\n(GB/s)","#wrong","time\n(us)","algbw\n(GB/s)","bus\n(GB/s)","#wrong"]
+    # One task per output file, so each workbook is loaded and saved once
+    workbooks = defaultdict(list)
     for elem in split_data:
         data = add_human_readable_size_column(elem['df'].drop(columns=["coll"]),"size","size_hr")
         coll_name = elem['sheetname'].removesuffix(".txt").removesuffix(".log")
-        write_custom_excel_sheet(elem['filename'],coll_name, data,output_dir, box1_text=bkcinfo,box2_text=cmdstr,box3_text=f"1-node {coll_name}",box4_text="out-of-place\n(mean of 10 consecutive runs)",box5_text="in-place\n(mean of 10 consecutive runs)",TransferBenchBW = TransferBenchBW ,header_row_texts=header_row_texts)
+        workbooks[elem['filename']].append(dict(coll_name=coll_name, df=data, box1_text=bkcinfo,box2_text=cmdstr,box3_text=f"1-node {coll_name}",box4_text="out-of-place\n(mean of 10 consecutive runs)",box5_text="in-place\n(mean of 10 consecutive runs)",TransferBenchBW = TransferBenchBW ,header_row_texts=header_row_texts))
+    # Output files are independent, write them concurrently
+    with ProcessPoolExecutor() as ex:
+        futures = [ex.submit(write_custom_excel_workbook, filename, sheets, output_dir) for filename, sheets in workbooks.items()]
+        for future in futures:
+            future.result()
    
 if __name__ == "__main__":
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,15 +10,11 @@ def getLibrcclPath(scratch_workdir):
 def getRcclTestsBinDir(scratch_workdir):
     return os.path.join(scratch_workdir,"rccl-tests","build")
 
-def write_to_log(message: str, file_path: str):
-    try:
-        log_dir = os.path.dirname(file_path)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
-        with open(file_path, 'w') as f:
-            f.write(message + '\n')
-    except Exception as e:
-        print(f"Error writing to log file '{file_path}': {e}")
+def tee_lines(lines, sink):
+    """Yield lines unchanged while writing each one to the open file sink."""
+    for line in lines:
+        sink.write(line)
+        yield line
 
 if __name__ == "__main__":
     scratch_workdir = "/home/apotnuru/SWDEV-535655/Temp"
@@ -38,23 +34,28 @@ if __name__ == "__main__":
         
     N = 10*17
     lastNCommits = get_last_n_commit_hashes(rccl_path, N)
-    results = []
-    output_json = os.path.join(scratch_workdir,"results.json")
-    for idx, commit in enumerate(lastNCommits[0:10]):
-        if BUILD_RCCL:
-            librccl = build_rccl(rccl_path,commit_hash=commit)
-        if BUILD_RT:
-            rccltests_binaries_path = build_rccl_tests(rccl_tests_path,custom_rccl=librccl,rccl_install=os.path.join(rccl_path,"build","debug"))
-        rt_args = {"-n":"2"}
-        outputlog = run_rccl_test("all_reduce",0,8,scratch_workdir,rccl_test_bin_subdir=rccltests_binaries_path,rt_args_dict=rt_args)
-        data = parse_rccl_tests_output(outputlog)
-        if data and len(data):
-            results.append({ "index": idx,"commit": commit,"data": data})
-            write_to_log(outputlog,os.path.join(scratch_workdir,"backup",f"{commit}.log"))
-        #checkpointing
-        if idx%4 == 0:
-            with open(output_json, "w") as f:
-                json.dump(results, f, default=str, indent=2)
-    with open(output_json, "w") as f:
-                json.dump(results, f, default=str, indent=2)
+    # One JSON record per line, written as each commit finishes (a new run starts a new file)
+    output_jsonl = os.path.join(scratch_workdir,"results.jsonl")
+    with open(output_jsonl, "w") as jf:
+        for idx, commit in enumerate(lastNCommits[0:10]):
+            if BUILD_RCCL:
+                librccl = build_rccl(rccl_path,commit_hash=commit)
+            if BUILD_RT:
+                rccltests_binaries_path = build_rccl_tests(rccl_tests_path,custom_rccl=librccl,rccl_install=os.path.dirname(librccl))
+            rt_args = {"-n":"2"}
+            # The raw output goes straight to the backup log while it is parsed
+            backup_log = os.path.join(scratch_workdir,"backup",f"{commit}.log")
+            os.makedirs(os.path.dirname(backup_log), exist_ok=True)
+            with open(backup_log, "w") as bf:
+                # Load this commit's librccl; its worktree build is not where the tests were linked
+                data = parse_rccl_tests_output(tee_lines(stream_rccl_test("all_reduce",0,8,scratch_workdir,rccl_test_bin_subdir=rccltests_binaries_path,rt_args_dict=rt_args,rccl_lib_dir=os.path.dirname(librccl)),bf))
+            if data.empty:
+                os.remove(backup_log)  # keep backups only for runs that produced data
+            else:
+                record = { "index": idx,"commit": commit,"data": data.to_dict("records")}
+                jf.write(json.dumps(record, default=str) + "\n")
+                jf.flush()
+            if BUILD_RCCL:
+                # The commit's build is no longer needed, free its worktree
+                remove_commit_worktree(rccl_path,commit)
 #3717829.PJsession
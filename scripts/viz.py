@@ -1,37 +1,32 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import json
 import os
 
-# Assume you have the flatten_json_to_dataframe and plot_dataframe_3d_interactive functions defined as above
+METRIC_COLUMNS = [
+    'size',
+    'op_time(us)', 'op_algbw(GB/s)', 'op_busbw(GB/s)',
+    'ip_time(us)', 'ip_algbw(GB/s)', 'ip_busbw(GB/s)',
+]
 
 def flatten_json_to_dataframe(json_data):
     """
     Flattens a specific JSON structure into a Pandas DataFrame.
-    (Same function as provided previously)
     """
     if isinstance(json_data, str):
         data = json.loads(json_data)
     else:
         data = json_data
 
-    flat_data = []
-    for entry in data:
-        commit_hash = entry.get('commit')
-        for item in entry.get('data', []):
-            row = {
-                'commit_hash': commit_hash,
-                'size': float(item.get('size')),
-                'op_time(us)': float(item.get('op_time(us)', 0.0)),
-                'op_algbw(GB/s)': float(item.get('op_algbw(GB/s)', 0.0)),
-                'op_busbw(GB/s)': float(item.get('op_busbw(GB/s)', 0.0)),
-                'ip_time(us)': float(item.get('ip_time(us)', 0.0)),
-                'ip_algbw(GB/s)': float(item.get('ip_algbw(GB/s)', 0.0)),
-                'ip_busbw(GB/s)': float(item.get('ip_busbw(GB/s)', 0.0)),
-            }
-            flat_data.append(row)
-
-    return pd.DataFrame(flat_data)
+    # Flatten all records at once; keys missing from a record, or values
+    # that are not numbers (e.g. "N/A"), become 0.0
+    df = pd.json_normalize(data, record_path='data', meta=['commit'])
+    df = df.rename(columns={'commit': 'commit_hash'})
+    df = df.reindex(columns=['commit_hash'] + METRIC_COLUMNS, fill_value=0.0)
+    for col in METRIC_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0).astype('float64')
+    return df
 
 def plot_dataframe_3d_interactive(
     df: pd.DataFrame,
@@ -45,62 +40,55 @@ def plot_dataframe_3d_interactive(
     log_y: bool = True,
     color_by_deviation: bool = True
 ):
-    import numpy as np
-    import plotly.graph_objects as go
-
     if not all(col in df.columns for col in [x_col, y_col] + dropdown_z_cols):
         raise ValueError("One or more specified columns are not in the DataFrame.")
 
     x_axis_title = x_axis_title if x_axis_title is not None else x_col
     y_axis_title = y_axis_title if y_axis_title is not None else (f"log({y_col})" if log_y else y_col)
-    y_data = np.log2(df[y_col]) if log_y else df[y_col]
-
-    data_traces = []
-
-    for i, col in enumerate(dropdown_z_cols):
-        visible = [False] * len(dropdown_z_cols)
-        visible[i] = True
-
-        z_data = df[col]
-        color_vals = None
+    # x/y are the same for every trace, convert them once
+    x_data = df[x_col].to_numpy()
+    y_data = np.log2(df[y_col].to_numpy()) if log_y else df[y_col].to_numpy()
+    if color_by_deviation:
+        # Max of every z column per y, in one groupby pass
+        group_max_all = df.groupby(y_col)[dropdown_z_cols].transform("max")
+
+    def z_and_color(col):
+        z_data = df[col].to_numpy()
         if color_by_deviation:
-            # Group by (x, y) and calculate average z
-            group_max = df.groupby([y_col])[col].transform("max")
-            color_vals = group_max - z_data
-        else:
-            color_vals = z_data  # or just use a default constant if no coloring
-
-        trace = go.Scatter3d(
-            x=df[x_col],
-            y=y_data,
-            z=z_data,
-            mode='lines+markers' if connect_points else 'markers',
-            name=col,
-            marker=dict(
-                size=3,
-                color=color_vals,
-                colorscale='thermal',
-                colorbar=dict(title="Deviation" if color_by_deviation else "Z"),
-                showscale=True
-            ),
-            visible=visible[i]
+            return z_data, group_max_all[col].to_numpy() - z_data
+        return z_data, z_data  # or just use a default constant if no coloring
+
+    # One trace carries x/y; the dropdown swaps its z and marker colors
+    # instead of switching between one full trace per column
+    z_data, color_vals = z_and_color(dropdown_z_cols[0])
+    trace = go.Scatter3d(
+        x=x_data,
+        y=y_data,
+        z=z_data,
+        mode='lines+markers' if connect_points else 'markers',
+        name=dropdown_z_cols[0],
+        marker=dict(
+            size=3,
+            color=color_vals,
+            colorscale='thermal',
+            colorbar=dict(title="Deviation" if color_by_deviation else "Z"),
+            showscale=True
         )
-        data_traces.append(trace)
+    )
 
     buttons = []
-    for i, col in enumerate(dropdown_z_cols):
-        visibility_settings = [False] * len(dropdown_z_cols)
-        visibility_settings[i] = True
-
+    for col in dropdown_z_cols:
+        z_data, color_vals = z_and_color(col)
         button = dict(
             label=col,
             method="update",
-            args=[{"visible": visibility_settings},
-                  {"scene.zaxis.title": col, "title.text": f"{plot_title}: {col}"}]
+            args=[{"z": [z_data], "marker.color": [color_vals], "name": col},
+                  {"scene.zaxis.title": col, "title.text": f"{plot_title}: {col}"},
+                  [0]]
         )
         buttons.append(button)
 
-    fig = go.Figure(data=data_traces)
+    fig = go.Figure(data=[trace])
 
     fig.update_layout(
         updatemenus=[
@@ -127,9 +115,11 @@ def plot_dataframe_3d_interactive(
     return fig
 
 def read_json(filepath):
+    # results.jsonl holds one record per line, older results.json one list
     with open(filepath, 'r') as f:
-        data = json.load(f)
-    return data
+        if filepath.endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
 
 if __name__ == "__main__":
     json_path = input("Enter the data Json path: ")